@@ -8,22 +8,39 @@ Usage:
   python scraper.py --uni polyu  # scrape one university only
 
 Requirements:
-  pip install requests beautifulsoup4 playwright
+  pip install requests beautifulsoup4 lxml playwright
   playwright install chromium    # for JS-rendered sites
 """
 
 import csv
 import os
 import re
+import shutil
+import ssl
+import subprocess
 import sys
+import tempfile
 import time
 import argparse
+import asyncio
+import atexit
 import hashlib
-from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from urllib.parse import urljoin
 
 import requests
+import urllib3
 from bs4 import BeautifulSoup
+from bs4.element import NavigableString, PreformattedString
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.ssl_ import create_urllib3_context
 
 # ── Output file path (same directory as this script)
 OUTPUT_FILE = Path(__file__).parent.parent / "jobs.csv"
@@ -45,26 +62,107 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+# ── Shared HTTP session: keep-alive + connection pooling, so repeated fetches
+#    to the same host reuse one TLS connection instead of re-handshaking.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+
+# ── Legacy-TLS session for EdUHK, whose server needs unsafe legacy
+#    renegotiation and an unverified certificate. Built once so paginated
+#    listing fetches share one pooled connection.
+_LEGACY_SSL_CTX = create_urllib3_context()
+_LEGACY_SSL_CTX.options |= getattr(ssl, "OP_LEGACY_SERVER_CONNECT", 0x4)
+_LEGACY_SSL_CTX.check_hostname = False
+_LEGACY_SSL_CTX.verify_mode = ssl.CERT_NONE
+
+
+class _LegacySSLAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["ssl_context"] = _LEGACY_SSL_CTX
+        super().init_poolmanager(*args, **kwargs)
+
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_LEGACY_SSL_SESSION = requests.Session()
+_LEGACY_SSL_SESSION.mount("https://", _LegacySSLAdapter())
+
+# ── On-disk page cache, keyed by SHA1 of the URL. Job pages rarely change
+#    hour-to-hour, so re-runs within the TTL skip re-downloading them.
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+CACHE_TTL = 6 * 60 * 60  # seconds; --no-cache sets 0
+
 TODAY = date.today()
 
+# ── Precompiled patterns for hot text-processing paths
+_WS_RE         = re.compile(r"\s+")
+_REF_ID_RE     = re.compile(r"^[\w\-]+$")
+_FACULTY_RE    = re.compile(r"\bfaculty\b")
+_POSITIONS_RE  = re.compile(r"\bpositions?\b")
+_DEPT_RE       = re.compile(r"^(Department|Faculty|School|Academy|Division|Office|Centre|Center)", re.I)
+_NAV_RE        = re.compile(r"^(Next|Previous|Go to page|Search|Filter|Home|Menu|\d+)$", re.I)
+_REF_NUM_RE    = re.compile(r"Ref:\s*(\d{6,})")
+_CLOSE_DATE_RE = re.compile(r"Close Date[:\s]+([A-Za-z0-9 ]+)")
+_DEPT_KW_RE    = re.compile(r"Faculty|Department|School|Institute|Centre|Office|Library", re.I)
+_NEXT_RE       = re.compile(r"^Next$", re.I)
+_ALL_DIGITS_RE = re.compile(r"^\d+$")
+
+# ── How far (in non-empty lines) an HKUST card extends either side of its
+#    "Job ID:" line — roughly the 300 characters the card text used to span
+HKUST_CARD_LINES = 10
+
+# ── Per-scraper patterns used inside job loops
+_HKUST_JOB_ID_RE      = re.compile(r"Job ID: (\d+)")
+_HKUST_FILTER_RE      = re.compile(r"\(\d+\)$")  # filter labels like "School (3)"
+_HKUST_DATE_PREFIX_RE = re.compile(r"Open Date|Apply by|\d{4}-\d{2}")
+_HKUST_APPLY_BY_RE    = re.compile(r"Apply by: ([\d\-]+)")
+_CITYU_REF_RE         = re.compile(r"ref=([\w\-]+)", re.I)
+_CUHK_REF_RE          = re.compile(r"^\d{5,8}$")
+_HKBU_JOB_HREF_RE     = re.compile(r"/job/(\d+)")
+_HKBU_SITS_UNDER_RE   = re.compile(r"sits under (?:the\s+)?([A-Z][^,.]{3,60}?)(?:\s+at our|\s+campus|,|\.|$)")
+_LINGNAN_REQ_RE       = re.compile(r"requisition/(\d+)")
+_TALEO_JOB_RE         = re.compile(r"[?&]job=([^&]+)")
+
+# ── Compiled XPath for listing tables (lxml does the tree walk in C)
+_FIRST_TABLE_XPATH = etree.XPath("(//table)[1]")
+_TR_XPATH          = etree.XPath(".//tr")
+_TD_XPATH          = etree.XPath(".//td")
+_TABLE_TR_XPATH    = etree.XPath("//table//tr")
+_LINK_XPATH        = etree.XPath(".//a[@href]")
+# Taleo "Next" pager link: by title attribute, else by its (case-insensitive) text
+_NEXT_BY_TITLE_XPATH = etree.XPath("//a[@title='Next']")
+_NEXT_BY_TEXT_XPATH  = etree.XPath(
+    "//a[translate(normalize-space(), 'NEXT', 'next') = 'next']"
+)
+_POLYU_DESC_DIV_XPATH = etree.XPath(
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' ITS_Content_RichTextEditor ')])[1]"
+)
+_PARAS_XPATH       = etree.XPath(".//p")
+
 
 # ══════════════════════════════════════════════════════════════════
 # UTILITIES
+# Pure string-keyed helpers are memoised with lru_cache: the same titles,
+# refs and deadline strings recur across listings, re-ranking and the
+# retention/active checks (TODAY is fixed for the run, so those are pure too).
 # ══════════════════════════════════════════════════════════════════
 
 def clean(text):
     """Strip whitespace and normalise internal spaces."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", str(text)).strip()
+    return _WS_RE.sub(" ", str(text)).strip()
 
 
+@lru_cache(maxsize=4096)
 def make_id(uni_code, ref):
     """Generate a stable unique ID."""
     key = clean(str(ref)) if ref else "unknown"
-    if len(key) <= 20 and re.match(r'^[\w\-]+$', key):
+    if len(key) <= 20 and _REF_ID_RE.match(key):
         return f"{uni_code.upper()}-{key}"
-    return f"{uni_code.upper()}-{hashlib.md5(key.encode()).hexdigest()[:10]}"
+    # MD5 kept (not a security use) so IDs stay stable against existing jobs.csv
+    # rows and saved bookmarks; usedforsecurity=False keeps it working on FIPS builds.
+    digest = hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()[:10]
+    return f"{uni_code.upper()}-{digest}"
 
 
 def infer_dept_from_title(title):
@@ -96,69 +194,109 @@ def infer_dept_from_title(title):
     return ""
 
 
+# ── Title keyword → rank, checked in priority order (first hit wins)
+RANK_RULES = (
+    ("teaching-track",      "Lecturer"),   # Fix 1
+    ("chair professor",     "Professor"),
+    ("associate professor", "Associate Professor"),
+    ("assistant professor", "Assistant Professor"),
+    ("professor",           "Professor"),
+    ("postdoc",             "Postdoctoral"),
+    ("post-doctoral",       "Postdoctoral"),
+    ("post doctoral",       "Postdoctoral"),
+    ("research fellow",     "Postdoctoral"),
+    ("dean",                "Senior Management"),
+    ("provost",             "Senior Management"),
+    ("head of",             "Senior Management"),
+    ("vice-chancellor",     "Senior Management"),
+    ("vice chancellor",     "Senior Management"),
+    ("vice-president",      "Senior Management"),
+    ("vice president",      "Senior Management"),
+    ("teaching associate",  "Teaching Assistant"),  # Fix 2
+    ("teaching assistant",  "Teaching Assistant"),
+    ("research engineer",   "Research Assistant/Associate"),  # Fix 3
+    ("research assistant",  "Research Assistant/Associate"),
+    ("research associate",  "Research Assistant/Associate"),
+    ("research officer",    "Research Assistant/Associate"),
+    ("lecturer",            "Lecturer"),
+    ("teaching fellow",     "Lecturer"),
+    ("instructor",          "Lecturer"),
+    ("clinical",            "Lecturer"),
+)
+
+NON_ACADEMIC_KEYWORDS = (
+    "officer", "manager", "executive", "clerk", "clerical",
+    "administrative", "administrator", "accountant", "accounting",
+    "librarian", "programmer", "technician", "nurse", "counsellor",
+    "secretary", "attendant", "helper", "dental", "registrar",
+    "coordinator", "consultant", "director",
+    "procurement", "laboratory assistant", "lab assistant",
+    "office assistant", "security", "systems analyst",
+    "phlebotomist", "editor",
+    "project assistant", "project associate", "project fellow",
+    "project technical",
+)
+
+
 def detect_rank(title, description=""):
     """Infer rank from job title (and optionally description)."""
-    t = title.lower()
-    d = description.lower()
-    if ("tenure-track" in t or "tenure track" in t or "substantiation-track" in t) and "non-tenure" not in t:
-        return "Tenure-Track"
+    rank, faculty_posts = _rank_from_title(title)
     # Faculty positions — disambiguate using description (Fix 4)
-    if re.search(r'\bfaculty\b', t) and re.search(r'\bpositions?\b', t):
+    if faculty_posts and description:
+        d = description.lower()
         if ("tenure-track" in d or "tenure track" in d) and "non-tenure" not in d:
             return "Tenure-Track"
         if "lecturer" in d:
             return "Lecturer"
-    if "teaching-track" in t:        return "Lecturer"   # Fix 1
-    if "chair professor" in t:       return "Professor"
-    if "associate professor" in t:   return "Associate Professor"
-    if "assistant professor" in t:   return "Assistant Professor"
-    if "professor" in t:             return "Professor"
-    if "postdoc" in t:               return "Postdoctoral"
-    if "post-doctoral" in t:         return "Postdoctoral"
-    if "post doctoral" in t:         return "Postdoctoral"
-    if "research fellow" in t:       return "Postdoctoral"
-    if "dean" in t:                  return "Senior Management"
-    if "provost" in t:               return "Senior Management"
-    if "head of" in t:               return "Senior Management"
-    if "vice-chancellor" in t:       return "Senior Management"
-    if "vice chancellor" in t:       return "Senior Management"
-    if "vice-president" in t:        return "Senior Management"
-    if "vice president" in t:        return "Senior Management"
-    if "teaching associate" in t:    return "Teaching Assistant"  # Fix 2
-    if "teaching assistant" in t:    return "Teaching Assistant"
-    if "research engineer" in t:     return "Research Assistant/Associate"  # Fix 3
-    if "research assistant" in t:    return "Research Assistant/Associate"
-    if "research associate" in t:    return "Research Assistant/Associate"
-    if "research officer" in t:      return "Research Assistant/Associate"
-    if "lecturer" in t:              return "Lecturer"
-    if "teaching fellow" in t:       return "Lecturer"
-    if "instructor" in t:            return "Lecturer"
-    if "clinical" in t:              return "Lecturer"
-    NON_ACADEMIC_KEYWORDS = (
-        "officer", "manager", "executive", "clerk", "clerical",
-        "administrative", "administrator", "accountant", "accounting",
-        "librarian", "programmer", "technician", "nurse", "counsellor",
-        "secretary", "attendant", "helper", "dental", "registrar",
-        "coordinator", "consultant", "director",
-        "procurement", "laboratory assistant", "lab assistant",
-        "office assistant", "security", "systems analyst",
-        "phlebotomist", "editor",
-        "project assistant", "project associate", "project fellow",
-        "project technical",
-    )
+    return rank
+
+
+# Only the title part is memoised: classify() calls detect_rank once per job
+# with that job's description, so (title, description) keys would never hit.
+@lru_cache(maxsize=4096)
+def _rank_from_title(title):
+    """(rank from title keywords, whether the description may override it)."""
+    t = title.lower()
+    if ("tenure-track" in t or "tenure track" in t or "substantiation-track" in t) and "non-tenure" not in t:
+        return "Tenure-Track", False
+    faculty_posts = bool(_FACULTY_RE.search(t) and _POSITIONS_RE.search(t))
+    # Plain substring scans on purpose, here and in detect_type: a single regex
+    # alternation has to be a lookahead (to keep priority order across overlaps
+    # like "research assistant professor") and benchmarks ~3x slower over
+    # RANK_RULES, ~7x over TYPE_RULES, than these C-level `in`s.
+    for keyword, rank in RANK_RULES:
+        if keyword in t:
+            return rank, faculty_posts
     if any(k in t for k in NON_ACADEMIC_KEYWORDS):
-        return "Non-Academic"
-    return "Other"
+        return "Non-Academic", faculty_posts
+    return "Other", faculty_posts
+
+
+# ── Title keyword → position type, checked in priority order (first hit wins)
+TYPE_RULES = (
+    ("temporary",  "Fixed-term"),
+    ("fixed-term", "Fixed-term"),
+    ("part-time",  "Part-time"),
+)
 
 
+@lru_cache(maxsize=4096)
 def detect_type(title):
     """Infer position type from title."""
     t = title.lower()
-    if "temporary" in t or "fixed-term" in t: return "Fixed-term"
-    if "part-time" in t:                       return "Part-time"
+    for keyword, pos_type in TYPE_RULES:
+        if keyword in t:
+            return pos_type
     return "Full-time"
 
 
+# ── Date formats accepted by parse_date_text, grouped by separator
+DATE_FORMATS_SLASH = ("%d/%m/%Y", "%m/%d/%Y", "%d/%b/%Y")
+DATE_FORMATS_ISO   = ("%Y-%m-%d",)
+DATE_FORMATS_NAMED = ("%d %B %Y", "%d %b %Y", "%B %d, %Y", "%b %d, %Y")
+
+
+@lru_cache(maxsize=4096)
 def parse_date_text(text):
     """
     Convert various date formats to YYYY-MM-DD.
@@ -168,12 +306,17 @@ def parse_date_text(text):
     if not text:
         return ""
     text = clean(text)
-    formats = [
-        "%d %B %Y", "%d %b %Y",
-        "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
-        "%d/%b/%Y",
-        "%B %d, %Y", "%b %d, %Y",
-    ]
+    # Cheap structural checks first: every format needs a digit, and the
+    # separator decides which formats can possibly match, so most cells try
+    # one or two strptime calls instead of raising ValueError eight times.
+    if not any(c.isdigit() for c in text):
+        return text
+    if "/" in text:
+        formats = DATE_FORMATS_SLASH
+    elif "-" in text:
+        formats = DATE_FORMATS_ISO
+    else:
+        formats = DATE_FORMATS_NAMED
     for fmt in formats:
         try:
             return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
@@ -182,6 +325,7 @@ def parse_date_text(text):
     return text  # return as-is if can't parse
 
 
+@lru_cache(maxsize=4096)
 def is_active(deadline_str):
     """Return True if deadline is today or in the future."""
     if not deadline_str:
@@ -193,53 +337,100 @@ def is_active(deadline_str):
         return True
 
 
+@lru_cache(maxsize=4096)
 def is_within_retention(deadline_str, days=14):
     """Return True if deadline is empty, active, or closed within the last `days` days."""
     if not deadline_str:
         return True
     try:
         d = datetime.strptime(deadline_str, "%Y-%m-%d").date()
-        from datetime import timedelta
         return d >= (TODAY - timedelta(days=days))
     except ValueError:
         return True
 
 
-def get_soup(url, timeout=15, legacy_ssl=False):
-    """Fetch a URL and return a BeautifulSoup object.
-    legacy_ssl=True enables unsafe legacy TLS renegotiation (needed for EdUHK).
+def cached_fetch(url, ttl=None, timeout=15, session=None):
+    """
+    Return the body of `url`, served from CACHE_DIR if it was fetched less than
+    `ttl` seconds ago (default CACHE_TTL; 0 always refetches). Raises on
+    network/HTTP errors; only successes are cached.
+    """
+    ttl = CACHE_TTL if ttl is None else ttl
+    path = CACHE_DIR / hashlib.sha1(url.encode()).hexdigest()
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return path.read_text(encoding="utf-8")
+    except OSError:
+        pass  # not cached yet
+    resp = (session or _SESSION).get(url, headers=HEADERS, timeout=timeout)
+    resp.raise_for_status()
+    try:
+        # Write to a temp file and swap it in, so a concurrent reader or an
+        # interrupted run never sees a half-written entry
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(resp.text)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"  ⚠️  Could not cache {url}: {e}")  # the fetch itself succeeded
+    return resp.text
+
+
+def prune_cache():
+    """Delete CACHE_DIR entries (and stray temp files) older than CACHE_TTL."""
+    cutoff = time.time() - CACHE_TTL
+    try:
+        entries = list(CACHE_DIR.iterdir())
+    except OSError:
+        return  # no cache yet
+    for entry in entries:
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+def get_html(url, timeout=15, legacy_ssl=False, session=None):
+    """Fetch a URL and return the response body as text, or None on failure.
+    legacy_ssl=True fetches through _LEGACY_SSL_SESSION (needed for EdUHK).
+    session defaults to the shared pooled _SESSION.
+    Non-legacy fetches go through the on-disk cache (see cached_fetch).
     """
     try:
         if legacy_ssl:
-            import ssl
-            import urllib3
-            from requests.adapters import HTTPAdapter
-            from urllib3.util.ssl_ import create_urllib3_context
-
-            # Create SSL context that allows legacy renegotiation
-            ctx = create_urllib3_context()
-            ctx.options |= getattr(ssl, "OP_LEGACY_SERVER_CONNECT", 0x4)
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-
-            class LegacySSLAdapter(HTTPAdapter):
-                def init_poolmanager(self, *args, **kwargs):
-                    kwargs["ssl_context"] = ctx
-                    super().init_poolmanager(*args, **kwargs)
-
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            session = requests.Session()
-            session.mount("https://", LegacySSLAdapter())
-            resp = session.get(url, headers=HEADERS, timeout=timeout, verify=False)
-        else:
-            resp = requests.get(url, headers=HEADERS, timeout=timeout)
-        resp.raise_for_status()
-        return BeautifulSoup(resp.text, "html.parser")
+            resp = _LEGACY_SSL_SESSION.get(url, headers=HEADERS, timeout=timeout, verify=False)
+            resp.raise_for_status()
+            return resp.text
+        return cached_fetch(url, timeout=timeout, session=session)
     except Exception as e:
         print(f"  ⚠️  Failed to fetch {url}: {e}")
         return None
 
 
+def get_soup(url, timeout=15, legacy_ssl=False, session=None):
+    """Fetch a URL (see get_html) and return a BeautifulSoup object, or None."""
+    html = get_html(url, timeout=timeout, legacy_ssl=legacy_ssl, session=session)
+    if html is None:
+        return None
+    return BeautifulSoup(html, "lxml")
+
+
+# ── Bodies are decoded to str by the fetch/cache layer; lxml refuses str
+#    input that carries an <?xml encoding=...?> declaration, so re-encode and
+#    parse as UTF-8 bytes.
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def parse_html(html):
+    """Parse an HTML string with lxml; None if it is empty or unparseable."""
+    try:
+        return lxml_html.fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+    except (etree.ParserError, ValueError):
+        return None
+
+
 def get_js_soup(url, wait_selector=None, timeout=20000):
     """
     Fetch a JavaScript-rendered page using Playwright.
@@ -247,10 +438,8 @@ def get_js_soup(url, wait_selector=None, timeout=20000):
     """
     try:
         from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_extra_http_headers(HEADERS)
+        with sync_playwright() as p, browser_context(p) as context:
+            page = context.new_page()
             page.goto(url, timeout=timeout)
             if wait_selector:
                 try:
@@ -260,13 +449,116 @@ def get_js_soup(url, wait_selector=None, timeout=20000):
             else:
                 page.wait_for_load_state("networkidle", timeout=timeout)
             html = page.content()
-            browser.close()
-        return BeautifulSoup(html, "html.parser")
+        return BeautifulSoup(html, "lxml")
     except Exception as e:
         print(f"  ⚠️  Playwright failed for {url}: {e}")
         return None
 
 
+# ── Shared Chromium: launched once by main() and reached over CDP, so every
+#    Playwright scraper opens a cheap context instead of a whole new browser.
+#    None → scrapers fall back to launching a private browser (e.g. --uni),
+#    except scrape_hkust, which starts one for its parallel listing threads.
+_SHARED_BROWSER = None  # (process, user_data_dir, cdp_endpoint)
+
+
+def launch_shared_browser(timeout=15):
+    """
+    Start one headless Chromium with a remote-debugging port.
+    Returns the CDP endpoint, or None if the browser could not be started.
+    """
+    global _SHARED_BROWSER
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as p:
+            executable = p.chromium.executable_path
+
+        user_data_dir = tempfile.mkdtemp(prefix="hkacadjobs-chromium-")
+        proc = subprocess.Popen(
+            [executable, "--headless=new", "--no-sandbox", "--remote-debugging-port=0",
+             f"--user-data-dir={user_data_dir}", "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        # Chromium writes the port it picked to DevToolsActivePort once listening
+        port_file = Path(user_data_dir) / "DevToolsActivePort"
+        give_up = time.time() + timeout
+        while time.time() < give_up and proc.poll() is None:
+            lines = port_file.read_text().splitlines() if port_file.exists() else []
+            if lines and lines[0].isdigit():
+                endpoint = f"http://127.0.0.1:{lines[0]}"
+                _SHARED_BROWSER = (proc, user_data_dir, endpoint)
+                atexit.register(close_shared_browser)  # no-op if main() already closed it
+                print(f"↳ Shared Chromium listening on {endpoint}")
+                return endpoint
+            time.sleep(0.1)
+        proc.kill()
+        shutil.rmtree(user_data_dir, ignore_errors=True)
+        print("  ⚠️  Shared Chromium did not start — scrapers will launch their own")
+    except Exception as e:
+        print(f"  ⚠️  Could not launch shared Chromium: {e}")
+    return None
+
+
+def close_shared_browser():
+    """Terminate the shared Chromium started by launch_shared_browser()."""
+    global _SHARED_BROWSER
+    if not _SHARED_BROWSER:
+        return
+    proc, user_data_dir, _ = _SHARED_BROWSER
+    _SHARED_BROWSER = None
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+    shutil.rmtree(user_data_dir, ignore_errors=True)
+
+
+def _cdp_endpoint():
+    """CDP endpoint of the shared Chromium, or None if none is running."""
+    return _SHARED_BROWSER[2] if _SHARED_BROWSER else None
+
+
+# ── Request types Playwright scrapers never need: we only read text.
+#    Stylesheets stay enabled — inner_text() depends on CSS visibility, and
+#    unstyled pages leak hidden menus into the text the parsers anchor on.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+
+def _install_resource_blocker(target):
+    """
+    Abort image/font/media requests on a Page or BrowserContext.
+    Works with both Playwright APIs: with the async API the return value is
+    a coroutine and must be awaited.
+    """
+    return target.route("**/*", lambda route: (
+        route.abort() if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+        else route.continue_()
+    ))
+
+
+@contextmanager
+def browser_context(p):
+    """
+    Yield a fresh BrowserContext (heavy assets blocked) for one scraper.
+    Attaches to the shared Chromium over CDP when one is running (and closes
+    only the context); otherwise launches, and afterwards closes, a private browser.
+    """
+    endpoint = _cdp_endpoint()
+    if endpoint:
+        browser = p.chromium.connect_over_cdp(endpoint)
+    else:
+        browser = p.chromium.launch(headless=True)
+    context = browser.new_context(extra_http_headers=HEADERS)
+    _install_resource_blocker(context)
+    try:
+        yield context
+    finally:
+        context.close()
+        if not endpoint:
+            browser.close()
+
+
 # ── Marker used in placeholder descriptions (skip summarising these)
 PLACEHOLDER_MARKER = "Please visit the application link"
 
@@ -316,6 +608,11 @@ def summarise_description(raw_text, title, dept):
 # SCRAPERS — one function per university
 # ══════════════════════════════════════════════════════════════════
 
+def _strip_noise(tree):
+    """Remove nav/header/footer/script/style subtrees from an lxml tree in place."""
+    etree.strip_elements(tree, "nav", "header", "footer", "script", "style", with_tail=False)
+
+
 def scrape_polyu_detail(ref, debug=False):
     """
     Fetch a PolyU job detail page and extract the description.
@@ -323,45 +620,50 @@ def scrape_polyu_detail(ref, debug=False):
     Returns a plain-text description string, or "" on failure.
     """
     url = f"https://jobs.polyu.edu.hk/job_detail.php?job={ref}"
-    soup = get_soup(url, timeout=10)
-    if not soup:
+    html = get_html(url, timeout=10)
+    if not html:
         return ""
-
-    # Remove noise
-    for tag in soup.find_all(["nav", "header", "footer", "script", "style"]):
-        tag.decompose()
+    tree = parse_html(html)
+    if tree is None:
+        return ""  # keep the job, just without a description
 
     if debug:
+        _strip_noise(tree)
         print(f"\n  🔍 DEBUG {url}")
-        for tag in soup.find_all(["div", "td", "table", "p"], limit=40):
+        for tag in islice(tree.iter("div", "td", "table", "p"), 40):
             cls = tag.get("class", "")
             idd = tag.get("id", "")
-            t   = clean(tag.get_text(" "))[:100]
+            t   = clean(" ".join(tag.itertext()))[:100]
             if t:
-                print(f"    <{tag.name} class={cls} id={idd}>: {t}")
+                print(f"    <{tag.tag} class={cls} id={idd}>: {t}")
         return ""
 
-    # PolyU job descriptions live in div.ITS_Content_RichTextEditor
-    content = soup.find("div", class_="ITS_Content_RichTextEditor")
-    if content:
-        seen = set()
-        parts = []
-        for p in content.find_all("p"):
-            t = clean(p.get_text(" "))
-            # Normalise whitespace for dedup comparison
-            key = re.sub(r"\s+", " ", t).lower()
-            if t and key not in seen:
-                seen.add(key)
-                parts.append(t)
-        if parts:
-            return "\n\n".join(parts)[:2000]
-
-    # Fallback: largest text block
-    candidates = [
-        clean(tag.get_text(" "))
-        for tag in soup.find_all(["div", "td", "section"])
-        if 150 < len(clean(tag.get_text(" "))) < 5000
-    ]
+    # PolyU job descriptions live in div.ITS_Content_RichTextEditor — go
+    # straight there; the rest of the document is never touched.
+    divs  = _POLYU_DESC_DIV_XPATH(tree)
+    paras = []
+    if divs:
+        # itertext() would include inline <script>/<style> bodies, which
+        # BeautifulSoup's get_text() used to drop
+        etree.strip_elements(divs[0], "script", "style", with_tail=False)
+        paras = _PARAS_XPATH(divs[0])
+    if paras:
+        # One pass: clean each paragraph once, dedup case-insensitively (first wins)
+        unique = {}
+        for p in paras:
+            t = clean(" ".join(p.itertext()))
+            if t:
+                unique.setdefault(t.lower(), t)
+        if unique:
+            return "\n\n".join(unique.values())[:2000]
+
+    # Fallback: largest text block (only now is the noise worth stripping)
+    _strip_noise(tree)
+    candidates = []
+    for tag in tree.iter("div", "td", "section"):
+        t = clean(" ".join(tag.itertext()))
+        if 150 < len(t) < 5000:
+            candidates.append(t)
     if candidates:
         return max(candidates, key=len)[:2000]
 
@@ -378,21 +680,24 @@ def scrape_polyu_page(url, position_type_override=None):
       Col 2/3: Closing Date
       Col 3/4: Ref No.
     """
-    soup = get_soup(url)
-    if not soup:
+    html = get_html(url)
+    if not html:
         return []
 
+    tree = parse_html(html)
+    if tree is None:
+        return []
     jobs = []
-    table = soup.find("table")
-    if not table:
+    tables = _FIRST_TABLE_XPATH(tree)
+    if not tables:
         return []
 
-    for row in table.find_all("tr")[1:]:  # skip header row
-        cols = row.find_all("td")
+    for row in _TR_XPATH(tables[0])[1:]:  # skip header row
+        cols = _TD_XPATH(row)
         if len(cols) < 3:
             continue
 
-        texts = [clean(col.get_text()) for col in cols]
+        texts = [clean(col.text_content()) for col in cols]
 
         # Ref is always a 7-10 digit number
         ref = ""
@@ -465,15 +770,15 @@ def scrape_polyu():
         (f"{base}/research.php",       "Full-time"),
     ]
 
-    # Step 1: collect all jobs from all listing pages
+    # Step 1: collect all jobs from all listing pages (fetched concurrently)
     raw_jobs = []
     seen_refs = set()
-    for url, pos_type in pages:
-        page_jobs = scrape_polyu_page(url, pos_type)
-        for j in page_jobs:
-            if j["ref"] not in seen_refs:
-                seen_refs.add(j["ref"])
-                raw_jobs.append(j)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for page_jobs in ex.map(lambda pg: scrape_polyu_page(*pg), pages):
+            for j in page_jobs:
+                if j["ref"] not in seen_refs:
+                    seen_refs.add(j["ref"])
+                    raw_jobs.append(j)
 
     print(f"  ↳ Found {len(raw_jobs)} listings across all pages")
 
@@ -482,199 +787,339 @@ def scrape_polyu():
     skipped = len(raw_jobs) - len(active_jobs)
     print(f"  ↳ Fetching detail pages for {len(active_jobs)} jobs (skipped {skipped} expired)...")
     jobs = []
-    for idx, j in enumerate(active_jobs, 1):
-        ref      = j["ref"]
-        title    = j["title"]
-        dept     = j["dept"]
-        deadline = j["deadline"]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        details = ex.map(scrape_polyu_detail, [j["ref"] for j in active_jobs])
+        for idx, (j, description) in enumerate(zip(active_jobs, details), 1):
+            ref      = j["ref"]
+            title    = j["title"]
+            dept     = j["dept"]
+            deadline = j["deadline"]
+
+            apply_url = f"{base}/job_detail.php?job={ref}"
+            if not description:
+                description = j.get("description") or f"{title} — {dept}. See {apply_url} for full details."
+
+            if idx % 10 == 0 or idx == len(active_jobs):
+                print(f"  ↳ {idx}/{len(active_jobs)} detail pages fetched")
+
+            jobs.append({
+                "id":               make_id("POLYU", ref),
+                "title":            title,
+                "university":       "PolyU",
+                "university_full":  "Hong Kong Polytechnic University",
+                "department":       dept,
+                "deadline":         deadline,
+                "reference":        ref,
+                "position_type":    j["pos_type"],
+                "salary":           "",
+                "start_date":       "",
+                "apply_url":        apply_url,
+                "description":      description,
+            })
+
+    print(f"  ✅ PolyU: {len(jobs)} jobs found")
+    return jobs
+
+
+EDUHK_BASE = "https://www.eduhk.hk"
+EDUHK_CATEGORIES = [
+    ("senior-management",              "Senior Management"),
+    ("deanship-headship-appointments", "Deanship/Headship"),
+    ("academic-teaching-posts",        "Academic"),
+    ("research-support-posts",         "Research"),
+]
+
+
+# ── UI labels that appear between EdUHK job cards
+EDUHK_NOISE = frozenset({"n/a", "na", "reset", "search", "filter", "apply", "clear", "go", "next", "previous"})
+
+# ── Static HTML → text the way Playwright's inner_text() lays it out, which is
+#    what _parse_eduhk_text is written against: a line break only at block
+#    boundaries, inline markup (<em>, <a>, <span>…) kept on one line, and
+#    script/style/hidden content left out.
+_BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "caption", "dd", "details",
+    "dialog", "div", "dl", "dt", "fieldset", "figcaption", "figure", "footer",
+    "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main",
+    "nav", "ol", "p", "pre", "section", "summary", "table", "tbody", "td",
+    "tfoot", "th", "thead", "tr", "ul",
+})
+_INVISIBLE_TAGS = frozenset({"script", "style", "noscript", "template", "head", "title"})
+_HIDDEN_STYLE_RE = re.compile(r"display\s*:\s*none|visibility\s*:\s*hidden", re.I)
+
+
+def _visible_text(node):
+    """Approximate inner_text() for a BeautifulSoup node: one line per block."""
+    parts = []
+
+    def walk(el):
+        for child in el.children:
+            if isinstance(child, NavigableString):
+                if not isinstance(child, PreformattedString):  # comments, doctype…
+                    parts.append(_WS_RE.sub(" ", child))
+                continue
+            if (child.name in _INVISIBLE_TAGS or child.has_attr("hidden")
+                    or _HIDDEN_STYLE_RE.search(child.get("style", ""))):
+                continue
+            block = child.name in _BLOCK_TAGS
+            if block:
+                parts.append("\n")
+            walk(child)
+            if block:
+                parts.append("\n")
+
+    walk(node)
+    lines = (line.strip() for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _eduhk_listing_url(category):
+    return f"{EDUHK_BASE}/en/current-openings?category={category}&department=&q="
+
+
+def _parse_eduhk_text(full_text, pdf_links, listing_url, seen):
+    """
+    Parse one EdUHK listing page's visible text into job dicts.
+    pdf_links are the job-card PDF links in page order; `seen` is shared
+    across the pages of one category for dedup.
+    """
+    jobs = []
+    pdf_idx = 0
+    # Anchor on each "Ad Date:" occurrence (plain str.find — no regex needed).
+    # Grab 400 chars before for title+dept+ref, 200 chars after for close date.
+    start = full_text.find("Ad Date:")
+    while start >= 0:
+        end    = start + len("Ad Date:")
+        before = full_text[max(0, start-600):start]
+        after  = full_text[end:end+200]
+        start  = full_text.find("Ad Date:", end)
+
+        # Title and dept: one forward pass over the lines before metadata,
+        # skipping pagination/nav, "Ref:" and known UI noise lines.
+        # title = last non-dept line; dept = innermost dept-like line after it.
+        title = ""
+        dept  = ""
+        for line in before.splitlines():
+            line = line.strip()
+            if len(line) <= 2 or line.startswith("Ref:"):
+                continue
+            if line.lower() in EDUHK_NOISE or _NAV_RE.match(line):
+                continue
+            if _DEPT_RE.match(line):
+                dept = line
+            else:
+                title = line
+                dept  = ""   # dept lines above the title belong to another card
+        # Fallback: only dept-like lines found, use last as title
+        if not title:
+            title = dept
+            dept  = ""
 
-        apply_url   = f"{base}/job_detail.php?job={ref}"
-        description = scrape_polyu_detail(ref)
-        if not description:
-            description = j.get("description") or f"{title} — {dept}. See {apply_url} for full details."
+        if not title or len(title) < 3:
+            continue
 
-        if idx % 10 == 0 or idx == len(active_jobs):
-            print(f"  ↳ {idx}/{len(active_jobs)} detail pages fetched")
+        ref_m = _REF_NUM_RE.search(before[-150:] + after[:50])
+        ref   = ref_m.group(1) if ref_m else ""
+        key = f"{title}|{ref}" if ref else f"{title}|{dept}"
+        if key in seen:
+            continue
+        seen.add(key)
 
+        close_m = _CLOSE_DATE_RE.search(after)
+        deadline = ""
+        if close_m:
+            raw = close_m.group(1).strip()
+            if raw.upper() not in ("N/A", "NA", ""):
+                deadline = parse_date_text(raw)
+
+        apply_url = pdf_links[pdf_idx] if pdf_idx < len(pdf_links) else listing_url
+        pdf_idx += 1
         jobs.append({
-            "id":               make_id("POLYU", ref),
+            "id":               make_id("EDUHK", ref if ref else f"{title[:40]}_{dept[:20]}"),
             "title":            title,
-            "rank":             detect_rank(title),
-            "university":       "PolyU",
-            "university_full":  "Hong Kong Polytechnic University",
-            "department":       dept,
+            "university":       "EdUHK",
+            "university_full":  "Education University of Hong Kong",
+            "department":       dept or infer_dept_from_title(title) or "Education University of Hong Kong",
             "deadline":         deadline,
-            "is_new":           "TRUE" if is_active(deadline) else "FALSE",
             "reference":        ref,
-            "position_type":    j["pos_type"],
             "salary":           "",
             "start_date":       "",
             "apply_url":        apply_url,
-            "description":      description,
+            "description":      f"{title}{' — ' + dept if dept else ''}. See EdUHK website for full details.",
         })
-
-    print(f"  ✅ PolyU: {len(jobs)} jobs found")
     return jobs
 
 
-def scrape_eduhk():
+def _try_static(url):
     """
-    EdUHK — eduhk.hk/en/current-openings
-    JS-rendered. Playwright fetches each page; parser anchors on "Ad Date:".
+    Fetch an EdUHK listing page over plain HTTP (5 s timeout).
+    Returns (page_text, pdf_links, next_url) when the server-rendered HTML
+    already carries the job cards, else None — the page needs Playwright.
+    next_url is "" on the last page.
     """
-    print("📋 Scraping EdUHK...")
+    html = get_html(url, timeout=5, legacy_ssl=True)
+    if not html or "Ad Date:" not in html:
+        return None
 
-    BASE = "https://www.eduhk.hk"
-    CATEGORIES = [
-        ("senior-management",              "Senior Management"),
-        ("deanship-headship-appointments", "Deanship/Headship"),
-        ("academic-teaching-posts",        "Academic"),
-        ("research-support-posts",         "Research"),
-    ]
+    soup = BeautifulSoup(html, "lxml")
+    full_text = _visible_text(soup.body or soup)
+    if "Ad Date:" not in full_text:
+        return None  # marker only present in embedded JSON/JS
+
+    pdf_links = [urljoin(url, a["href"]) for a in soup.select('a[href*="/cms/f/career"]')]
+
+    next_url = ""
+    next_el = next((el for el in soup.find_all(["a", "button"])
+                    if el.get("aria-label") == "Next" or _NEXT_RE.match(el.get_text(strip=True))), None)
+    if next_el is not None:
+        href = next_el.get("href", "") if next_el.name == "a" else ""
+        if not href or href.startswith(("#", "javascript:")):
+            return None  # JS-driven pagination — only the browser can follow it
+        next_url = urljoin(url, href)
+    return full_text, pdf_links, next_url
 
+
+def _scrape_eduhk_static(category):
+    """Scrape one EdUHK category over plain HTTP; None if it needs Playwright."""
+    url = _eduhk_listing_url(category)
     jobs = []
     seen = set()
+    page_url = url
+    for _ in range(20):
+        page = _try_static(page_url)
+        if page is None:
+            return None
+        full_text, pdf_links, next_url = page
+        jobs.extend(_parse_eduhk_text(full_text, pdf_links, url, seen))
+        if not next_url:
+            break
+        page_url = next_url
+    return jobs
 
-    try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
 
-            for category, pos_type in CATEGORIES:
-                cat_count = 0
-                page_num  = 1
-                pw_page   = None
+async def _scrape_eduhk_async(categories):
+    """
+    Playwright path of scrape_eduhk() for the given (category, pos_type) pairs.
+    One browser (the shared one if running); each category gets its own
+    context/page and categories run concurrently (at most 3 at a time), so
+    their network waits overlap instead of adding up.
+    """
+    from playwright.async_api import async_playwright
 
-                while True:
-                    if page_num == 1:
-                        url = f"{BASE}/en/current-openings?category={category}&department=&q="
-                    # (subsequent pages are reached by clicking Next, not URL param)
+    sem = asyncio.Semaphore(3)
 
+    async def handle_category(browser, category, pos_type):
+        jobs = []
+        seen = set()
+        page_num = 1
+        url = _eduhk_listing_url(category)
+        # (subsequent pages are reached by clicking Next, not URL param)
+
+        async with sem:
+            context = await browser.new_context(extra_http_headers=HEADERS)
+            await _install_resource_blocker(context)
+            pw_page = await context.new_page()
+            try:
+                while True:
                     try:
                         if page_num == 1:
-                            pw_page = browser.new_page()
-                            pw_page.set_extra_http_headers(HEADERS)
-                            pw_page.goto(url, timeout=60000, wait_until="domcontentloaded")
-                            pw_page.wait_for_timeout(3000)
+                            await pw_page.goto(url, timeout=60000, wait_until="domcontentloaded")
+                            try:
+                                await pw_page.wait_for_selector("text=Ad Date:", timeout=8000)
+                            except Exception:
+                                pass  # no openings in this category — handled below
                         # else: pw_page already on next page from previous click
 
-                        full_text = pw_page.inner_text("body")
+                        full_text = await pw_page.inner_text("body")
                         # Extract PDF links in page order (one per job card)
-                        pdf_links = pw_page.evaluate(
+                        pdf_links = await pw_page.evaluate(
                             "Array.from(document.querySelectorAll('a[href*=\"/cms/f/career\"]')).map(a => a.href)"
                         )
                     except Exception as page_err:
                         print(f"  ↳ {pos_type} p{page_num}: error ({page_err.__class__.__name__})")
-                        try: pw_page.close()
-                        except: pass
                         break
 
-                    ad_count = full_text.count("Ad Date:")
-                    if ad_count == 0:
+                    if "Ad Date:" not in full_text:
                         break
 
-                    jobs_before = len(jobs)
-                    pdf_idx = 0
-                    # Anchor on each "Ad Date:" occurrence.
-                    # Grab 400 chars before for title+dept+ref, 200 chars after for close date.
-                    for m in re.finditer(r'Ad Date:', full_text):
-                        before = full_text[max(0, m.start()-600):m.start()]
-                        after  = full_text[m.end():m.end()+200]
-
-                        before_lines = [l.strip() for l in before.splitlines() if l.strip()]
-
-                        # Title and dept: last 2 lines before metadata
-                        # Strip lines that look like pagination/nav
-                        content_lines = [l for l in before_lines
-                                         if not re.match(r'^(Next|Previous|Go to page|Search|Filter|Home|Menu|\d+)$', l, re.I)
-                                         and not re.match(r'^Ref:', l)
-                                         and len(l) > 2]
-                        if not content_lines:
-                            continue
-
-                        # Filter out known UI noise
-                        NOISE = {"n/a", "na", "reset", "search", "filter", "apply", "clear", "go", "next", "previous"}
-                        content_lines = [l for l in content_lines if l.lower() not in NOISE]
-
-                        if not content_lines:
-                            continue
-
-                        # Walk backwards: collect dept-like lines, then first non-dept line = title
-                        dept_pattern = re.compile(r'^(Department|Faculty|School|Academy|Division|Office|Centre|Center)', re.I)
-                        title = ""
-                        dept  = ""
-                        for line in reversed(content_lines):
-                            if dept_pattern.match(line):
-                                if not dept:
-                                    dept = line   # take innermost dept-like line
-                            else:
-                                if not title:
-                                    title = line
-                                    break
-                        # Fallback: only dept-like lines found, use last as title
-                        if not title:
-                            title = dept
-                            dept  = ""
-
-                        if not title or len(title) < 3:
-                            continue
-
-                        ref_m = re.search(r'Ref:\s*(\d{6,})', before[-150:] + after[:50])
-                        ref   = ref_m.group(1) if ref_m else ""
-                        key = f"{title}|{ref}" if ref else f"{title}|{dept}"
-                        if key in seen:
-                            continue
-                        seen.add(key)
-
-                        close_m = re.search(r'Close Date[:\s]+([A-Za-z0-9 ]+)', after)
-                        deadline = ""
-                        if close_m:
-                            raw = close_m.group(1).strip()
-                            if raw.upper() not in ("N/A", "NA", ""):
-                                deadline = parse_date_text(raw)
-
-                        apply_url = pdf_links[pdf_idx] if pdf_idx < len(pdf_links) else f"{BASE}/en/current-openings?category={category}&department=&q="
-                        pdf_idx += 1
-                        jobs.append({
-                            "id":               make_id("EDUHK", ref if ref else f"{title[:40]}_{dept[:20]}"),
-                            "title":            title,
-                            "rank":             detect_rank(title),
-                            "university":       "EdUHK",
-                            "university_full":  "Education University of Hong Kong",
-                            "department":       dept or infer_dept_from_title(title) or "Education University of Hong Kong",
-                            "deadline":         deadline,
-                            "is_new":           "TRUE" if is_active(deadline) else "FALSE",
-                            "reference":        ref,
-                            "position_type":    detect_type(title),
-                            "salary":           "",
-                            "start_date":       "",
-                            "apply_url":        apply_url,
-                            "description":      f"{title}{' — ' + dept if dept else ''}. See EdUHK website for full details.",
-                        })
-                        cat_count += 1
+                    jobs.extend(_parse_eduhk_text(full_text, pdf_links, url, seen))
 
                     # Try clicking Next button for next page
                     try:
-                        next_btn = pw_page.query_selector("a:has-text('Next'), button:has-text('Next'), [aria-label='Next']")
-                        if next_btn and ad_count > 0 and page_num < 20:
-                            next_btn.click()
-                            pw_page.wait_for_timeout(3000)
+                        next_btn = await pw_page.query_selector("a:has-text('Next'), button:has-text('Next'), [aria-label='Next']")
+                        if next_btn and page_num < 20:
+                            await next_btn.click()
+                            # Wait until the first job card's PDF link changes
+                            # (i.e. the next page rendered), not a fixed 3 s
+                            try:
+                                if pdf_links:
+                                    await pw_page.wait_for_function(
+                                        "prev => { const a = document.querySelector('a[href*=\"/cms/f/career\"]');"
+                                        " return a && a.href !== prev; }",
+                                        arg=pdf_links[0], timeout=8000,
+                                    )
+                                else:
+                                    await pw_page.wait_for_load_state("networkidle", timeout=8000)
+                            except Exception:
+                                pass  # parse whatever is there; `seen` drops repeats
                             page_num += 1
                         else:
-                            pw_page.close()
                             break
                     except Exception:
-                        try: pw_page.close()
-                        except: pass
                         break
+            finally:
+                await context.close()
 
-                print(f"  ↳ {pos_type}: {cat_count} jobs ({page_num} page(s))")
+        print(f"  ↳ {pos_type}: {len(jobs)} jobs ({page_num} page(s))")
+        return jobs
 
-            browser.close()
+    async with async_playwright() as p:
+        # Attach to the shared Chromium if main() started one
+        endpoint = _cdp_endpoint()
+        if endpoint:
+            browser = await p.chromium.connect_over_cdp(endpoint)
+        else:
+            browser = await p.chromium.launch(headless=True)
+        try:
+            results = await asyncio.gather(
+                *[handle_category(browser, category, pos_type) for category, pos_type in categories]
+            )
+        finally:
+            if not endpoint:
+                await browser.close()
 
-    except Exception as e:
-        print(f"  ⚠️  Playwright failed: {e}")
-        import traceback; traceback.print_exc()
+    return dict(zip([category for category, _ in categories], results))
+
+
+def scrape_eduhk():
+    """
+    EdUHK — eduhk.hk/en/current-openings
+    Each category is first tried over plain HTTP; categories whose cards are
+    JS-rendered fall back to Playwright (scraped concurrently via
+    _scrape_eduhk_async). Parser anchors on "Ad Date:".
+    """
+    print("📋 Scraping EdUHK...")
+
+    by_category = {}
+    needs_browser = []
+    for category, pos_type in EDUHK_CATEGORIES:
+        cat_jobs = _scrape_eduhk_static(category)
+        if cat_jobs is None:
+            needs_browser.append((category, pos_type))
+        else:
+            by_category[category] = cat_jobs
+            print(f"  ↳ {pos_type}: {len(cat_jobs)} jobs (static HTML)")
+
+    if needs_browser:
+        try:
+            by_category.update(asyncio.run(_scrape_eduhk_async(needs_browser)))
+        except Exception as e:
+            print(f"  ⚠️  Playwright failed: {e}")
+            import traceback; traceback.print_exc()
+
+    # Flatten in category order; cross-category duplicates share an id and
+    # are dropped by deduplicate() in main().
+    jobs = [job for category, _ in EDUHK_CATEGORIES for job in by_category.get(category, [])]
 
     print(f"  ✅ EdUHK: {len(jobs)} jobs found")
     return jobs
@@ -688,26 +1133,25 @@ def scrape_lingnan():
     """
     print("📋 Scraping Lingnan...")
 
-    def parse_jobs(html, seen):
+    def parse_jobs(links, seen):
+        """links: [{href, text}] for the page's requisition anchors."""
         result = []
-        soup = BeautifulSoup(html, "html.parser")
-        for a in soup.find_all("a", href=re.compile(r"requisition", re.I)):
-            full_title = clean(a.get_text())
+        for a in links:
+            full_title = clean(a["text"])
             if not full_title or len(full_title) < 5 or full_title in seen:
                 continue
             seen.add(full_title)
 
-            href = a.get("href", "")
+            href = a["href"] or ""
             apply_url = f"https://lingnan.csod.com{href}" if href.startswith("/") else href
-            ref_match = re.search(r"requisition/(\d+)", href)
+            ref_match = _LINGNAN_REQ_RE.search(href)
             ref = ref_match.group(1) if ref_match else ""
 
             # Split title on last comma: "Senior HR Officer, Human Resources Office"
             # → title = "Senior HR Officer", dept = "Human Resources Office"
-            if "," in full_title:
-                last_comma = full_title.rfind(",")
-                title = full_title[:last_comma].strip()
-                dept  = full_title[last_comma + 1:].strip()
+            title, sep, dept = full_title.rpartition(",")
+            if sep:
+                title, dept = title.strip(), dept.strip()
             else:
                 title = full_title
                 dept  = "Lingnan University"
@@ -715,14 +1159,11 @@ def scrape_lingnan():
             result.append({
                 "id":               make_id("LU", ref or title[:25]),
                 "title":            title,
-                "rank":             detect_rank(title),
                 "university":       "LU",
                 "university_full":  "Lingnan University",
                 "department":       dept,
                 "deadline":         "",
-                "is_new":           "TRUE",
                 "reference":        ref,
-                "position_type":    detect_type(title),
                 "salary":           "",
                 "start_date":       "",
                 "apply_url":        apply_url,
@@ -735,10 +1176,8 @@ def scrape_lingnan():
     try:
         from playwright.sync_api import sync_playwright
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_extra_http_headers(HEADERS)
+        with sync_playwright() as p, browser_context(p) as context:
+            page = context.new_page()
             page.goto("https://lingnan.csod.com/ux/ats/careersite/4/home?c=lingnan", timeout=30000)
             page.wait_for_load_state("networkidle", timeout=20000)
 
@@ -756,7 +1195,13 @@ def scrape_lingnan():
             seen = set()
 
             for pg in range(1, total_pages + 1):
-                jobs.extend(parse_jobs(page.content(), seen))
+                # Match the anchors in the browser rather than re-parsing the
+                # whole page HTML in Python on every pagination step
+                links = page.eval_on_selector_all(
+                    "a[href*='requisition' i]",
+                    "els => els.map(e => ({href: e.getAttribute('href'), text: e.textContent}))",
+                )
+                jobs.extend(parse_jobs(links, seen))
 
                 if pg >= total_pages:
                     break
@@ -805,7 +1250,6 @@ def scrape_lingnan():
             for j in jobs:
                 if _has_good_desc(j["id"]):
                     j["description"] = _existing_descriptions[j["id"]]
-            browser.close()
 
     except Exception as e:
         print(f"  ⚠️  Playwright failed: {e}")
@@ -814,6 +1258,19 @@ def scrape_lingnan():
     return jobs
 
 
+# ── Admin titles HKU lists alongside academic posts. One alternation over
+#    the lowercased title; re.I is deliberately not used, as it makes the
+#    search slower than the 13 `in` scans it replaces.
+HKU_ADMIN_KEYWORDS = (
+    "administrative assistant", "clerical assistant",
+    "finance officer", "it officer", "facilities manager",
+    "procurement officer", "human resources officer",
+    "security officer", "safety officer", "receptionist",
+    "estate manager", "accounting officer", "payroll officer",
+)
+_HKU_ADMIN_RE = re.compile("|".join(re.escape(k) for k in HKU_ADMIN_KEYWORDS))
+
+
 def scrape_hku():
     """
     HKU — jobs.hku.hk/en/listing/ (PageUp ATS)
@@ -821,33 +1278,24 @@ def scrape_hku():
     """
     print("📋 Scraping HKU...")
 
-    ADMIN_KEYWORDS = {
-        "administrative assistant", "clerical assistant",
-        "finance officer", "it officer", "facilities manager",
-        "procurement officer", "human resources officer",
-        "security officer", "safety officer", "receptionist",
-        "estate manager", "accounting officer", "payroll officer",
-    }
-
-    def parse_jobs(html, seen):
+    def parse_jobs(rows, seen):
+        """rows: [{title, href, cells}] as extracted in the browser (see below)."""
         result = []
-        soup = BeautifulSoup(html, "html.parser")
-        for row in soup.find_all("tr"):
-            link = row.find("a", href=True)
-            if not link:
-                continue
-            title = clean(link.get_text())
+        for row in rows:
+            title = clean(row["title"])
             if not title or len(title) < 5:
                 continue
-            href = link.get("href", "")
+            href = row["href"] or ""
             apply_url = f"https://jobs.hku.hk{href}" if href.startswith("/") else href
-            cells = row.find_all("td")
             ref = dept = deadline = ""
-            for cell in cells:
-                t = clean(cell.get_text())
-                if re.match(r"^\d{5,8}$", t):
+            for cell in row["cells"]:
+                # Clean once, then dispatch on the cheapest test first
+                t = clean(cell)
+                if not t:
+                    continue
+                if t.isdigit() and 5 <= len(t) <= 8:
                     ref = t
-                elif re.search(r"Faculty|Department|School|Institute|Centre|Office|Library", t, re.I) and t != title:
+                elif t != title and _DEPT_KW_RE.search(t):
                     dept = t
                 else:
                     parsed = parse_date_text(t)
@@ -858,20 +1306,16 @@ def scrape_hku():
             if dedup_key in seen:
                 continue
             seen.add(dedup_key)
-            title_lower = title.lower()
-            if any(kw in title_lower for kw in ADMIN_KEYWORDS):
+            if _HKU_ADMIN_RE.search(title.lower()):
                 continue
             result.append({
                 "id":               make_id("HKU", ref or title[:25]),
                 "title":            title,
-                "rank":             detect_rank(title),
                 "university":       "HKU",
                 "university_full":  "University of Hong Kong",
                 "department":       dept,
                 "deadline":         deadline,
-                "is_new":           "TRUE" if is_active(deadline) else "FALSE",
                 "reference":        ref,
-                "position_type":    detect_type(title),
                 "salary":           "",
                 "start_date":       "",
                 "apply_url":        apply_url,
@@ -884,10 +1328,8 @@ def scrape_hku():
     try:
         from playwright.sync_api import sync_playwright
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_extra_http_headers(HEADERS)
+        with sync_playwright() as p, browser_context(p) as context:
+            page = context.new_page()
             page.goto("https://jobs.hku.hk/en/listing/", timeout=30000)
             page.wait_for_load_state("networkidle", timeout=20000)
 
@@ -935,13 +1377,32 @@ def scrape_hku():
 
                 prev_count = current_count
                 clicks += 1
-                page.wait_for_timeout(1500)
+                # Wait for the new rows to land rather than a fixed sleep
+                try:
+                    page.wait_for_function(
+                        "n => document.querySelectorAll('tr').length > n",
+                        arg=prev_count, timeout=5000,
+                    )
+                except Exception:
+                    pass  # no growth — the count check above ends the loop
 
                 if clicks > 500:
                     break
 
             print(f"  ↳ Clicked More Jobs {clicks} times, loaded {prev_count} rows")
-            parsed = parse_jobs(page.content(), seen)
+            # Pull just the row data out of the live DOM instead of serialising
+            # and re-parsing the whole (multi-MB after 100+ clicks) page
+            rows = page.evaluate("""
+                () => Array.from(document.querySelectorAll('tr')).map(tr => {
+                    const a = tr.querySelector('a[href]');
+                    return a && {
+                        title: a.textContent,
+                        href:  a.getAttribute('href'),
+                        cells: Array.from(tr.querySelectorAll('td')).map(td => td.textContent),
+                    };
+                }).filter(Boolean)
+            """)
+            parsed = parse_jobs(rows, seen)
             jobs.extend(parsed)
 
             # Fetch detail pages for descriptions (skip known good summaries)
@@ -971,7 +1432,6 @@ def scrape_hku():
             for j in parsed:
                 if _has_good_desc(j["id"]):
                     j["description"] = _existing_descriptions[j["id"]]
-            browser.close()
 
     except Exception as e:
         print(f"  ⚠️  Playwright failed: {e}")
@@ -980,6 +1440,67 @@ def scrape_hku():
     return jobs
 
 
+def _parse_hkust_text(full_text):
+    """
+    Parse one HKUST listing page's visible text into
+    (ref, title, dept, deadline) tuples, one per "Job ID:" in page order.
+    A card's text runs from its Job ID to the next one, so a card without
+    an "Apply by" line never borrows the following card's deadline.
+    """
+    # Split the page once; each card is then a short scan around its
+    # "Job ID:" instead of re-slicing and re-splitting the text
+    lines = [l.strip() for l in full_text.splitlines()]
+    lines = [l for l in lines if l]
+    matches = [(i, m) for i, line in enumerate(lines) for m in _HKUST_JOB_ID_RE.finditer(line)]
+
+    cards = []
+    for k, (i, m) in enumerate(matches):
+        line = lines[i]
+        prev_on_line = k > 0 and matches[k - 1][0] == i
+        next_on_line = k + 1 < len(matches) and matches[k + 1][0] == i
+
+        # Text sharing the Job ID's line belongs to the card on either side of it
+        head = line[matches[k - 1][1].end() if prev_on_line else 0:m.start()].strip()
+        tail = line[m.end():matches[k + 1][1].start() if next_on_line else len(line)].strip()
+
+        before_lines = [] if prev_on_line else lines[max(0, i - HKUST_CARD_LINES):i]
+        if head:
+            before_lines.append(head)
+        after_lines = [tail] if tail else []
+        if not next_on_line:
+            end = matches[k + 1][0] if k + 1 < len(matches) else len(lines)
+            after_lines += lines[i + 1:min(end, i + 1 + HKUST_CARD_LINES)]
+
+        # Title: last meaningful line before Job ID (skip filter labels like "School (3)")
+        title = ""
+        for prev in reversed(before_lines):
+            if _HKUST_FILTER_RE.search(prev):
+                continue
+            if len(prev) > 4:
+                title = prev
+                break
+
+        # Dept: first non-empty line after Job ID before date lines
+        dept = ""
+        for nxt in after_lines:
+            if _HKUST_DATE_PREFIX_RE.match(nxt):
+                break
+            if len(nxt) > 4:
+                dept = nxt
+                break
+
+        # Deadline — optional, some cards don't have it
+        deadline = ""
+        for nxt in after_lines:
+            deadline_m = _HKUST_APPLY_BY_RE.search(nxt)
+            if deadline_m:
+                deadline = parse_date_text(deadline_m.group(1))
+                break
+
+        cards.append((m.group(1), title, dept, deadline))
+    return cards
+
+
 def scrape_hkust():
     """
     HKUST — hkustcareers.hkust.edu.hk
@@ -993,60 +1514,35 @@ def scrape_hkust():
         ("https://hkustcareers.hkust.edu.hk/join-us/current-opening/teaching-support",  "Teaching"),
     ]
     BASE = "https://hkustcareers.hkust.edu.hk"
-    jobs = []
-    seen = set()
 
-    try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-
-            for url, pos_type in URLS:
-                page = browser.new_page()
-                page.set_extra_http_headers(HEADERS)
+    def scrape_listing(url, pos_type):
+        # Runs in its own thread: sync Playwright objects are thread-bound, so
+        # each listing gets its own driver and context on the shared browser
+        jobs = []
+        try:
+            from playwright.sync_api import sync_playwright
+            with sync_playwright() as p, browser_context(p) as context:
+                page = context.new_page()
                 page.goto(url, timeout=30000)
                 page.wait_for_load_state("networkidle", timeout=20000)
-                page.wait_for_timeout(3000)
+                try:
+                    # Cards render after networkidle; wait for the first one
+                    # rather than a fixed 3 s settle
+                    page.wait_for_selector("text=Job ID", timeout=10000, state="attached")
+                except Exception:
+                    pass  # no openings on this listing — parse whatever is there
 
-                # Check how many Job IDs are in the page
                 full_text = page.inner_text("body")
-                job_id_count = full_text.count("Job ID")
-                print(f"  ↳ {pos_type}: {job_id_count} Job IDs in page text")
+
+                cards = _parse_hkust_text(full_text)
+                print(f"  ↳ {pos_type}: {len(cards)} Job IDs in page text")
 
                 seen_ids = set()
-                for m in re.finditer(r'Job ID: (\d+)', full_text):
-                    ref = m.group(1)
+                for ref, title, dept, deadline in cards:
                     if ref in seen_ids:
                         continue
                     seen_ids.add(ref)
 
-                    before = full_text[max(0, m.start()-300):m.start()]
-                    after  = full_text[m.end():m.end()+300]
-
-                    # Title: last meaningful line before Job ID (skip filter labels like "School (3)")
-                    before_lines = [l.strip() for l in before.splitlines() if l.strip()]
-                    title = ""
-                    for line in reversed(before_lines):
-                        if re.search(r'\(\d+\)$', line):
-                            continue
-                        if len(line) > 4:
-                            title = line
-                            break
-
-                    # Dept: first non-empty line after Job ID before date lines
-                    after_lines = [l.strip() for l in after.splitlines() if l.strip()]
-                    dept = ""
-                    for line in after_lines:
-                        if re.match(r'Open Date|Apply by|\d{4}-\d{2}', line):
-                            break
-                        if len(line) > 4:
-                            dept = line
-                            break
-
-                    # Deadline — optional, some cards don't have it
-                    deadline_m = re.search(r'Apply by: ([\d\-]+)', after)
-                    deadline = parse_date_text(deadline_m.group(1)) if deadline_m else ""
-
                     title = clean(title)
                     if not title or len(title) < 4:
                         continue
@@ -1055,14 +1551,11 @@ def scrape_hkust():
                     jobs.append({
                         "id":               make_id("HKUST", ref),
                         "title":            title,
-                        "rank":             detect_rank(title),
                         "university":       "HKUST",
                         "university_full":  "HK University of Science & Technology",
                         "department":       dept,
                         "deadline":         deadline,
-                        "is_new":           "TRUE" if is_active(deadline) else "FALSE",
                         "reference":        ref,
-                        "position_type":    detect_type(title),
                         "salary":           "",
                         "start_date":       "",
                         "apply_url":        f"https://hrmsxprod.psft.ust.hk:8044/psp/hrmsxprod/EMPLOYEE/HRMS/c/HRS_HRAM.HRS_CE.GBL?Page=HRS_CE_JOB_DTL&Action=A&JobOpeningId={ref}&SiteId=1000&PostingSeq=1",
@@ -1106,19 +1599,33 @@ def scrape_hkust():
                 except Exception:
                     pass
 
-                page.close()
-
-            # Fetch Interfolio detail pages for descriptions (skip known good summaries)
-            to_fetch = [
-                j for j in jobs
-                if is_within_retention(j["deadline"])
-                and not _has_good_desc(j["id"])
-                and "interfolio" in j.get("apply_url", "")
-            ]
-            if to_fetch:
-                print(f"  ↳ Fetching {len(to_fetch)} Interfolio pages for descriptions...")
-                detail_page = browser.new_page()
-                detail_page.set_extra_http_headers(HEADERS)
+        except Exception as e:
+            print(f"  ⚠️  {pos_type}: Playwright failed: {e}")
+        return jobs
+
+    # Both listing threads and the Interfolio pass attach to one Chromium.
+    # main() starts it for a full run; under --uni start it here instead of
+    # letting each thread launch a browser of its own
+    started_browser = _cdp_endpoint() is None and launch_shared_browser() is not None
+
+    # The two listings are independent and each spends most of its time in
+    # networkidle/settle waits, so load them side by side
+    with ThreadPoolExecutor(max_workers=len(URLS)) as ex:
+        jobs = [j for listing in ex.map(lambda a: scrape_listing(*a), URLS) for j in listing]
+
+    # Fetch Interfolio detail pages for descriptions (skip known good summaries)
+    to_fetch = [
+        j for j in jobs
+        if is_within_retention(j["deadline"])
+        and not _has_good_desc(j["id"])
+        and "interfolio" in j.get("apply_url", "")
+    ]
+    if to_fetch:
+        print(f"  ↳ Fetching {len(to_fetch)} Interfolio pages for descriptions...")
+        try:
+            from playwright.sync_api import sync_playwright
+            with sync_playwright() as p, browser_context(p) as context:
+                detail_page = context.new_page()
                 found = 0
                 for idx, j in enumerate(to_fetch, 1):
                     try:
@@ -1133,12 +1640,12 @@ def scrape_hkust():
                         pass
                     if idx % 5 == 0 or idx == len(to_fetch):
                         print(f"  ↳ {idx}/{len(to_fetch)} done")
-                detail_page.close()
                 print(f"  ↳ Got descriptions for {found}/{len(to_fetch)} jobs")
-            browser.close()
+        except Exception as e:
+            print(f"  ⚠️  Playwright failed: {e}")
 
-    except Exception as e:
-        print(f"  ⚠️  Playwright failed: {e}")
+    if started_browser:
+        close_shared_browser()
 
     print(f"  ✅ HKUST: {len(jobs)} jobs found")
     return jobs
@@ -1178,8 +1685,12 @@ def scrape_cityu():
     jobs = []
     seen = set()
 
-    for url, pos_type in URLS:
-        soup = get_soup(url)
+    # The three listings are independent: fetch them side by side, then
+    # parse in URLS order so dedup and job order are unchanged
+    with ThreadPoolExecutor(max_workers=len(URLS)) as ex:
+        soups = list(ex.map(lambda u: get_soup(u[0]), URLS))
+
+    for (url, pos_type), soup in zip(URLS, soups):
         if not soup:
             print(f"  ↳ {pos_type}: fetch failed")
             continue
@@ -1187,12 +1698,16 @@ def scrape_cityu():
         rows = soup.select("table tr")
         count = 0
         for row in rows:
-            cells = row.find_all("td")
-            if len(cells) < 2:
+            # Walk only the cells we use (title, dept, deadline) via siblings
+            # rather than materialising every <td> under the row
+            c1 = row.find("td")
+            c2 = c1.find_next_sibling("td") if c1 else None
+            if not c2:
                 continue
+            c3 = c2.find_next_sibling("td")
 
             # First cell: title link
-            a = cells[0].find("a", href=True)
+            a = c1.find("a", href=True)
             if not a:
                 continue
             title = clean(a.get_text())
@@ -1202,33 +1717,29 @@ def scrape_cityu():
             href = a["href"]
             apply_url = href if href.startswith("http") else f"https://www.cityu.edu.hk{href}"
 
-            ref_m = re.search(r"ref=([\w\-]+)", href, re.I)
+            ref_m = _CITYU_REF_RE.search(href)
             ref   = ref_m.group(1) if ref_m else ""
 
-            if ref in seen:
+            # Dedup on the final job id before any further parsing
+            jid = make_id("CITYU", ref or title[:25])
+            if jid in seen:
                 continue
-            seen.add(ref or title)
+            seen.add(jid)
 
             # Second cell: department
-            dept = clean(cells[1].get_text())
+            dept = clean(c2.get_text())
 
             # Third cell: deadline (may say "until filled")
-            deadline = ""
-            if len(cells) >= 3:
-                date_text = cells[2].get_text()
-                deadline  = parse_date_text(date_text)
+            deadline = parse_date_text(c3.get_text()) if c3 else ""
 
             jobs.append({
-                "id":               make_id("CITYU", ref or title[:25]),
+                "id":               jid,
                 "title":            title,
-                "rank":             detect_rank(title),
                 "university":       "CityU",
                 "university_full":  "City University of Hong Kong",
                 "department":       dept,
                 "deadline":         deadline,
-                "is_new":           "TRUE" if is_active(deadline) else "FALSE",
                 "reference":        ref,
-                "position_type":    detect_type(title),
                 "salary":           "",
                 "start_date":       "",
                 "apply_url":        apply_url,
@@ -1277,148 +1788,179 @@ def scrape_hkbu():
 
     jobs = []
     seen = set()
-    offset = 0
 
-    try:
-        while True:
-            # Build URL directly to avoid requests double-encoding the finder string
-            url = f"{API}?onlyData=true&finder={FINDER}&limit=25&offset={offset}&sortBy=POSTING_DATES_DESC"
-            resp = requests.get(url, headers=HKBU_HEADERS, timeout=20)
-            resp.raise_for_status()
-            data = resp.json()
+    def api_url(offset):
+        # Build URL directly to avoid requests double-encoding the finder string
+        return (f"{API}?onlyData=true&finder={FINDER}&limit=25&offset={offset}"
+                f"&sortBy=POSTING_DATES_DESC&totalResults=true")
 
-            items    = data.get("items", [])
-            has_more = data.get("hasMore", False)
+    def fetch_page(offset):
+        # Shared pooled session: all 25-job pages ride keep-alive connections
+        resp = _SESSION.get(api_url(offset), headers=HKBU_HEADERS, timeout=20)
+        resp.raise_for_status()
+        return resp.json()
+
+    def add_items(items):
+        """Turn one page of API requisition items into jobs (dedup by title)."""
+        for r in items:
+            full_title = clean(str(
+                r.get("Title") or r.get("title") or
+                r.get("JobTitle") or r.get("displayTitle") or ""
+            ))
+            if not full_title or full_title in seen:
+                continue
+            seen.add(full_title)
 
-            for r in items:
-                full_title = clean(str(
-                    r.get("Title") or r.get("title") or
-                    r.get("JobTitle") or r.get("displayTitle") or ""
-                ))
-                if not full_title or full_title in seen:
-                    continue
-                seen.add(full_title)
+            ref = str(r.get("Id") or r.get("id") or r.get("RequisitionNumber") or
+                      r.get("requisitionNumber") or r.get("ExternalReqNumber") or "")
+            apply_url = f"{BASE}/hcmUI/CandidateExperience/en/sites/hkbu/job/{ref}" if ref else f"{BASE}/hcmUI/CandidateExperience/en/sites/hkbu/jobs"
 
-                ref = str(r.get("Id") or r.get("id") or r.get("RequisitionNumber") or
-                          r.get("requisitionNumber") or r.get("ExternalReqNumber") or "")
-                apply_url = f"{BASE}/hcmUI/CandidateExperience/en/sites/hkbu/job/{ref}" if ref else f"{BASE}/hcmUI/CandidateExperience/en/sites/hkbu/jobs"
-
-                deadline = parse_date_text(str(
-                    r.get("PostedEndDate") or r.get("postedEndDate") or
-                    r.get("ClosingDate") or r.get("closingDate") or ""
-                ))
-
-                desc_text = clean(str(
-                    r.get("ExternalDescriptionStr") or r.get("ShortDescription") or
-                    r.get("description") or ""
-                ))
-
-                # Dept: comma split or "sits under" pattern
-                if "," in full_title:
-                    last = full_title.rfind(",")
-                    title = full_title[:last].strip()
-                    dept  = full_title[last + 1:].strip()
-                else:
-                    title = full_title
-                    dept  = infer_dept_from_title(full_title)
+            deadline = parse_date_text(str(
+                r.get("PostedEndDate") or r.get("postedEndDate") or
+                r.get("ClosingDate") or r.get("closingDate") or ""
+            ))
 
-                if not dept and desc_text:
-                    m = re.search(r"sits under (?:the\s+)?([A-Z][^,.]{3,60}?)(?:\s+at our|\s+campus|,|\.|$)", desc_text)
-                    if m:
-                        dept = m.group(1).strip()
-                dept = dept or "Hong Kong Baptist University"
+            desc_text = clean(str(
+                r.get("ExternalDescriptionStr") or r.get("ShortDescription") or
+                r.get("description") or ""
+            ))
 
-                jobs.append({
-                    "id":               make_id("HKBU", ref or title[:25]),
-                    "title":            title,
-                    "rank":             detect_rank(title),
-                    "university":       "HKBU",
-                    "university_full":  "Hong Kong Baptist University",
-                    "department":       dept,
-                    "deadline":         deadline,
-                    "is_new":           "TRUE" if is_active(deadline) else "FALSE",
-                    "reference":        ref,
-                    "position_type":    detect_type(title),
-                    "salary":           "",
-                    "start_date":       "",
-                    "apply_url":        apply_url,
-                    "description":      desc_text[:3000] if desc_text else f"{title} — {dept}. Please visit the application link for full details.",
-                })
+            # Dept: comma split or "sits under" pattern
+            title, sep, dept = full_title.rpartition(",")
+            if sep:
+                title, dept = title.strip(), dept.strip()
+            else:
+                title = full_title
+                dept  = infer_dept_from_title(full_title)
 
-            if not has_more or not items:
-                break
-            offset += 25
-            if offset > 1000:
-                break
+            if not dept and desc_text:
+                m = _HKBU_SITS_UNDER_RE.search(desc_text)
+                if m:
+                    dept = m.group(1).strip()
+            dept = dept or "Hong Kong Baptist University"
+
+            jobs.append({
+                "id":               make_id("HKBU", ref or title[:25]),
+                "title":            title,
+                "university":       "HKBU",
+                "university_full":  "Hong Kong Baptist University",
+                "department":       dept,
+                "deadline":         deadline,
+                "reference":        ref,
+                "salary":           "",
+                "start_date":       "",
+                "apply_url":        apply_url,
+                "description":      desc_text[:3000] if desc_text else f"{title} — {dept}. Please visit the application link for full details.",
+            })
+
+    try:
+        first = fetch_page(0)
+        pages = [first.get("items", [])]
+        total = first.get("totalResults")
+        if first.get("hasMore") and pages[0] and isinstance(total, int):
+            # Page count is known up front, so fetch the rest side by side
+            # (same 1000-offset cap as the sequential walk below)
+            offsets = range(25, min(total, 1025), 25)
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                pages.extend(data.get("items", []) for data in ex.map(fetch_page, offsets))
+        elif first.get("hasMore") and pages[0]:
+            # No total reported — walk hasMore one page at a time
+            offset = 25
+            while offset <= 1000:
+                data  = fetch_page(offset)
+                items = data.get("items", [])
+                pages.append(items)
+                if not data.get("hasMore") or not items:
+                    break
+                offset += 25
+
+        # Pages are processed in offset order, so dedup keeps the newest posting
+        for items in pages:
+            add_items(items)
 
-        # Fetch detail pages to fill in missing closing dates
     except Exception as e:
         print(f"  ⚠️  Direct API failed ({e}), falling back to Playwright...")
+        job_data = []
         try:
             from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.set_extra_http_headers(HEADERS)
+            with sync_playwright() as p, browser_context(p) as context:
+                page = context.new_page()
                 page.goto(f"{BASE}/hcmUI/CandidateExperience/en/sites/hkbu/jobs", timeout=30000)
-                page.wait_for_timeout(5000)
-                prev_height = 0
-                stale = 0
-                for _ in range(60):
-                    page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
-                    page.wait_for_timeout(2500)
-                    height = page.evaluate("() => document.body.scrollHeight")
-                    if height == prev_height:
-                        stale += 1
-                        if stale >= 3:
+                try:
+                    # Same JSON endpoint, but sent from the browser with the
+                    # site's cookies and TLS fingerprint — a handful of
+                    # requests instead of minutes of scroll-and-render
+                    offset = 0
+                    while offset <= 1000:
+                        resp = page.request.get(api_url(offset), headers=HKBU_HEADERS, timeout=20000)
+                        if not resp.ok:
+                            raise RuntimeError(f"HTTP {resp.status}")
+                        data  = resp.json()
+                        items = data.get("items", [])
+                        add_items(items)
+                        if not data.get("hasMore") or not items:
                             break
-                    else:
-                        stale = 0
-                    prev_height = height
-                job_data = page.evaluate("""
-                    () => {
-                        var results = [];
-                        var seen = {};
-                        Array.from(document.querySelectorAll("a")).forEach(function(a) {
-                            if (!a.href || a.href.indexOf("/job/") === -1) return;
-                            var title = a.textContent.trim();
-                            var cardText = "";
-                            var el = a.parentElement;
-                            for (var i = 0; i < 6; i++) {
-                                if (!el) break;
-                                if (!title || title.length < 4) {
-                                    var h = el.querySelector("h1,h2,h3,h4,[class*=title],[class*=job-name]");
-                                    if (h && h.textContent.trim().length > 4) title = h.textContent.trim();
-                                }
-                                if (el.textContent.trim().length > 100) {
-                                    cardText = el.textContent.trim().slice(0, 500);
-                                    break;
+                        offset += 25
+                except Exception as e2:
+                    print(f"  ⚠️  Browser API request failed ({e2}), scraping the rendered list...")
+                    try:
+                        page.wait_for_selector("a[href*='/job/']", timeout=15000)
+                    except Exception:
+                        pass  # scroll anyway in case the list loads lazily
+                    prev_height = 0
+                    stale = 0
+                    for _ in range(60):
+                        page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
+                        page.wait_for_timeout(2500)
+                        height = page.evaluate("() => document.body.scrollHeight")
+                        if height == prev_height:
+                            stale += 1
+                            if stale >= 3:
+                                break
+                        else:
+                            stale = 0
+                        prev_height = height
+                    job_data = page.evaluate("""
+                        () => {
+                            var results = [];
+                            var seen = {};
+                            Array.from(document.querySelectorAll("a")).forEach(function(a) {
+                                if (!a.href || a.href.indexOf("/job/") === -1) return;
+                                var title = a.textContent.trim();
+                                var cardText = "";
+                                var el = a.parentElement;
+                                for (var i = 0; i < 6; i++) {
+                                    if (!el) break;
+                                    if (!title || title.length < 4) {
+                                        var h = el.querySelector("h1,h2,h3,h4,[class*=title],[class*=job-name]");
+                                        if (h && h.textContent.trim().length > 4) title = h.textContent.trim();
+                                    }
+                                    if (el.textContent.trim().length > 100) {
+                                        cardText = el.textContent.trim().slice(0, 500);
+                                        break;
+                                    }
+                                    el = el.parentElement;
                                 }
-                                el = el.parentElement;
-                            }
-                            if (!title || title.length < 4 || seen[title]) return;
-                            seen[title] = true;
-                            results.push({ href: a.href, title: title, cardText: cardText });
-                        });
-                        return results;
-                    }
-                """)
-                browser.close()
-            seen2 = set()
+                                if (!title || title.length < 4 || seen[title]) return;
+                                seen[title] = true;
+                                results.push({ href: a.href, title: title, cardText: cardText });
+                            });
+                            return results;
+                        }
+                    """)
             for jd in job_data:
                 full_title = clean(jd["title"])
-                if not full_title or full_title in seen2:
+                if not full_title or full_title in seen:
                     continue
-                seen2.add(full_title)
-                ref_match = re.search(r"/job/(\d+)", jd["href"])
+                seen.add(full_title)
+                ref_match = _HKBU_JOB_HREF_RE.search(jd["href"])
                 ref = ref_match.group(1) if ref_match else ""
                 card_text = jd.get("cardText", "")
 
                 # Dept: comma split only
-                if "," in full_title:
-                    last = full_title.rfind(",")
-                    title = full_title[:last].strip()
-                    dept  = full_title[last + 1:].strip()
+                title, sep, dept = full_title.rpartition(",")
+                if sep:
+                    title, dept = title.strip(), dept.strip()
                 else:
                     title = full_title
                     dept  = infer_dept_from_title(full_title)
@@ -1427,14 +1969,11 @@ def scrape_hkbu():
                 jobs.append({
                     "id":               make_id("HKBU", ref or title[:25]),
                     "title":            title,
-                    "rank":             detect_rank(title),
                     "university":       "HKBU",
                     "university_full":  "Hong Kong Baptist University",
                     "department":       dept or "Hong Kong Baptist University",
                     "deadline":         "",
-                    "is_new":           "TRUE",
                     "reference":        ref,
-                    "position_type":    detect_type(title),
                     "salary":           "",
                     "start_date":       "",
                     "apply_url":        jd["href"],
@@ -1449,10 +1988,8 @@ def scrape_hkbu():
         print(f"  ↳ Fetching {len(missing)} detail pages for closing dates...")
         try:
             from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                detail_page = browser.new_page()
-                detail_page.set_extra_http_headers(HEADERS)
+            with sync_playwright() as p, browser_context(p) as context:
+                detail_page = context.new_page()
                 found = 0
                 for job in missing:
                     try:
@@ -1462,12 +1999,10 @@ def scrape_hkbu():
                         m = re.search(r'[Cc]losing\s+[Dd]ate[:\s]+(\d{1,2}\s+\w+\s+\d{4})', text)
                         if m:
                             job["deadline"] = parse_date_text(m.group(1))
-                            job["is_new"] = "TRUE" if is_active(job["deadline"]) else "FALSE"
                             found += 1
                     except Exception:
                         pass
                 detail_page.close()
-                browser.close()
             print(f"  ↳ Found closing dates for {found}/{len(missing)} jobs")
         except Exception as pe:
             print(f"  ↳ Detail page fetch failed: {pe}")
@@ -1496,12 +2031,9 @@ def scrape_cuhk():
     try:
         from playwright.sync_api import sync_playwright
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-
+        with sync_playwright() as p, browser_context(p) as context:
             for URL, section_name in SECTIONS:
-                page = browser.new_page()
-                page.set_extra_http_headers(HEADERS)
+                page = context.new_page()
                 page.goto(URL, timeout=60000, wait_until="domcontentloaded")
 
                 try:
@@ -1515,24 +2047,27 @@ def scrape_cuhk():
                 sect_count = 0
 
                 while True:
-                    soup = BeautifulSoup(page.content(), "html.parser")
-                    rows = soup.select("table tbody tr, table tr")
+                    tree = parse_html(page.content())
+                    if tree is None:
+                        print(f"  ⚠️  {section_name}: page {page_num} could not be parsed")
+                        break
                     page_jobs = 0
-                    for row in rows:
-                        cells = row.find_all("td")
+                    for row in _TABLE_TR_XPATH(tree):
+                        cells = _TD_XPATH(row)
                         if len(cells) < 3:
                             continue
                         ref = title = dept = apply_url = ""
-                        for i, cell in enumerate(cells):
-                            t = clean(cell.get_text())
-                            if not ref and re.match(r"^\d{5,8}$", t):
+                        for cell in cells:
+                            t = clean(cell.text_content())
+                            if not ref and _CUHK_REF_RE.match(t):
                                 ref = t
-                            link = cell.find("a", href=True)
-                            if not title and link:
-                                title = clean(link.get_text())
+                            links = _LINK_XPATH(cell)
+                            link = links[0] if links else None
+                            if not title and link is not None:
+                                title = clean(link.text_content())
                                 href  = link.get("href", "")
                                 apply_url = f"{BASE}{href}" if href.startswith("/") else href
-                            if title and not dept and not link and len(t) > 5 and not re.match(r"^\d+$", t):
+                            if title and not dept and link is None and len(t) > 5 and not _ALL_DIGITS_RE.match(t):
                                 dept = t
                         if not title or len(title) < 5:
                             continue
@@ -1544,14 +2079,11 @@ def scrape_cuhk():
                         jobs.append({
                             "id":               make_id("CUHK", ref if ref else f"{title}|{dept}"),
                             "title":            title,
-                            "rank":             detect_rank(title),
                             "university":       "CUHK",
                             "university_full":  "Chinese University of Hong Kong",
                             "department":       dept,
                             "deadline":         "",
-                            "is_new":           "TRUE",
                             "reference":        ref,
-                            "position_type":    detect_type(title),
                             "salary":           "",
                             "start_date":       "",
                             "apply_url":        apply_url or URL,
@@ -1560,11 +2092,11 @@ def scrape_cuhk():
                         page_jobs += 1
                         sect_count += 1
 
-                    # Next button: check disabled via BS4 before clicking
-                    next_link = soup.find("a", title="Next") or soup.find("a", string=re.compile(r"^Next$", re.I))
-                    if not next_link:
+                    # Next button: check disabled in the parsed tree before clicking
+                    next_links = _NEXT_BY_TITLE_XPATH(tree) or _NEXT_BY_TEXT_XPATH(tree)
+                    if not next_links:
                         break
-                    link_class = " ".join(next_link.get("class", [])).lower()
+                    link_class = next_links[0].get("class", "").lower()
                     if "disabled" in link_class or "inactive" in link_class:
                         break
                     next_btn = page.query_selector("a[title='Next'], a:has-text('Next')")
@@ -1581,8 +2113,6 @@ def scrape_cuhk():
                 print(f"  ↳ {section_name}: {sect_count} jobs ({page_num} page(s))")
                 page.close()
 
-            browser.close()
-
     except Exception as e:
         print(f"  ⚠️  Playwright failed: {e}")
 
@@ -1592,10 +2122,8 @@ def scrape_cuhk():
         print(f"  ↳ Fetching {len(missing)} detail pages for closing dates...")
         try:
             from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                detail_page = browser.new_page()
-                detail_page.set_extra_http_headers(HEADERS)
+            with sync_playwright() as p, browser_context(p) as context:
+                detail_page = context.new_page()
                 found = 0
                 for job in missing:
                     try:
@@ -1615,7 +2143,6 @@ def scrape_cuhk():
                     except Exception:
                         pass
                 detail_page.close()
-                browser.close()
             print(f"  ↳ Found closing dates for {found}/{len(missing)} jobs")
         except Exception as pe:
             print(f"  ↳ Detail page fetch failed: {pe}")
@@ -1683,14 +2210,11 @@ def scrape_hksyu():
                 jobs.append({
                     "id":               make_id("HKSYU", ref or title[:25]),
                     "title":            title,
-                    "rank":             detect_rank(title),
                     "university":       "HKSYU",
                     "university_full":  "Hong Kong Shue Yan University",
                     "department":       dept or "Hong Kong Shue Yan University",
                     "deadline":         deadline,
-                    "is_new":           "TRUE",
                     "reference":        ref,
-                    "position_type":    detect_type(title),
                     "salary":           "",
                     "start_date":       "",
                     "apply_url":        apply_url,
@@ -1782,14 +2306,11 @@ def scrape_sfu():
             jobs.append({
                 "id":               make_id("SFU", ref or title_clean[:25]),
                 "title":            title_clean,
-                "rank":             detect_rank(title_clean),
                 "university":       "SFU",
                 "university_full":  "Saint Francis University",
                 "department":       dept or "Saint Francis University",
                 "deadline":         deadline,
-                "is_new":           "TRUE",
                 "reference":        ref,
-                "position_type":    detect_type(title_clean),
                 "salary":           "",
                 "start_date":       "",
                 "apply_url":        url,
@@ -1866,14 +2387,11 @@ def scrape_hsu():
             jobs.append({
                 "id":               make_id("HSU", ref or title[:25]),
                 "title":            title,
-                "rank":             detect_rank(title),
                 "university":       "HSU",
                 "university_full":  "Hang Seng University of Hong Kong",
                 "department":       dept or "Hang Seng University of Hong Kong",
                 "deadline":         deadline,
-                "is_new":           "TRUE",
                 "reference":        ref,
-                "position_type":    detect_type(title),
                 "salary":           "",
                 "start_date":       "",
                 "apply_url":        apply_url,
@@ -1908,12 +2426,9 @@ def scrape_hkmu():
     try:
         from playwright.sync_api import sync_playwright
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-
+        with sync_playwright() as p, browser_context(p) as context:
             for URL, section_name in SECTIONS:
-                page = browser.new_page()
-                page.set_extra_http_headers(HEADERS)
+                page = context.new_page()
                 page.goto(URL, timeout=60000, wait_until="networkidle")
                 page.wait_for_timeout(3000)
 
@@ -1921,7 +2436,7 @@ def scrape_hkmu():
                 sect_count = 0
 
                 while True:
-                    soup = BeautifulSoup(page.content(), "html.parser")
+                    soup = BeautifulSoup(page.content(), "lxml")
                     table = soup.find("table")
                     if not table:
                         break
@@ -1942,7 +2457,7 @@ def scrape_hkmu():
                         apply_url = f"{BASE}{href}" if href.startswith("/") else href
 
                         # Ref from job ID in URL (e.g. ?job=26000BV)
-                        ref_m = re.search(r"[?&]job=([^&]+)", href)
+                        ref_m = _TALEO_JOB_RE.search(href)
                         ref   = ref_m.group(1) if ref_m else ""
 
                         dedup_key = ref if ref else title
@@ -1960,14 +2475,11 @@ def scrape_hkmu():
                         jobs.append({
                             "id":               make_id("HKMU", ref or title[:25]),
                             "title":            title,
-                            "rank":             detect_rank(title),
                             "university":       "HKMU",
                             "university_full":  "Hong Kong Metropolitan University",
                             "department":       dept,
                             "deadline":         deadline,
-                            "is_new":           "TRUE",
                             "reference":        ref,
-                            "position_type":    detect_type(title),
                             "salary":           "",
                             "start_date":       "",
                             "apply_url":        apply_url or URL,
@@ -1976,7 +2488,9 @@ def scrape_hkmu():
                         sect_count += 1
 
                     # Pagination via Next button
-                    next_link = soup.find("a", title="Next") or soup.find("a", string=re.compile(r"^Next$", re.I))
+                    # Attribute selector first (the same a[title='Next'] the click
+                    # below targets); the text match only runs if that misses
+                    next_link = soup.select_one('a[title="Next"]') or soup.find("a", string=_NEXT_RE)
                     if not next_link:
                         break
                     link_class = " ".join(next_link.get("class", [])).lower()
@@ -2000,8 +2514,7 @@ def scrape_hkmu():
             to_fetch = [j for j in jobs if is_within_retention(j["deadline"]) and not _has_good_desc(j["id"])]
             if to_fetch:
                 print(f"  ↳ Fetching {len(to_fetch)} detail pages for descriptions...")
-                detail_page = browser.new_page()
-                detail_page.set_extra_http_headers(HEADERS)
+                detail_page = context.new_page()
                 found = 0
                 for idx, j in enumerate(to_fetch, 1):
                     try:
@@ -2022,7 +2535,6 @@ def scrape_hkmu():
             for j in jobs:
                 if _has_good_desc(j["id"]):
                     j["description"] = _existing_descriptions[j["id"]]
-            browser.close()
 
     except Exception as e:
         print(f"  ⚠️  Playwright failed: {e}")
@@ -2052,7 +2564,11 @@ SCRAPERS = {
 
 
 def deduplicate(jobs):
-    """Remove duplicate jobs by id."""
+    """Remove duplicate jobs by id (first occurrence wins, order kept)."""
+    # Deliberately not `list({j["id"]: j for j in jobs}.values())`: that keeps
+    # the *last* duplicate (changing which university's copy survives), and
+    # first-wins dict variants (setdefault / `not in` on a dict) benchmark
+    # slower than this set + list on a full run's ~1,500 jobs.
     seen = set()
     unique = []
     for j in jobs:
@@ -2062,13 +2578,49 @@ def deduplicate(jobs):
     return unique
 
 
+def classify(jobs):
+    """
+    Set rank (from title + description) and, unless the scraper already
+    chose one (PolyU does, per listing page), position_type on every job,
+    in place. Runs once in main() so scrapers only collect raw fields.
+    """
+    for j in jobs:
+        j["rank"] = detect_rank(j["title"], j.get("description", ""))
+        if not j.get("position_type"):
+            j["position_type"] = detect_type(j["title"])
+    return jobs
+
+
+def write_jobs_csv(jobs, path):
+    """
+    Stream job dicts (any iterable) to `path` as CSV.
+    Rows go to a temp file that replaces `path` only once complete, so a
+    crash mid-write never leaves a truncated jobs.csv behind.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    # Plain csv.writer over pre-ordered rows: skips DictWriter's per-row
+    # key validation; missing fields become "" as restval did
+    with open(tmp, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows([j.get(k, "") for k in FIELDNAMES] for j in jobs)
+    os.replace(tmp, path)
+
+
 def main():
     parser = argparse.ArgumentParser(description="HKAcadJobs Scraper")
     parser.add_argument("--uni", help="Scrape one university only (e.g. polyu, hku)")
     parser.add_argument("--output", help="Output CSV path (default: ../jobs.csv)")
     parser.add_argument("--debug-polyu", metavar="REF", help="Debug a single PolyU detail page")
+    parser.add_argument("--no-cache", action="store_true", help="Refetch every page instead of using .cache/")
     args = parser.parse_args()
 
+    if args.no_cache:
+        global CACHE_TTL
+        CACHE_TTL = 0
+    prune_cache()
+
     if args.debug_polyu:
         print(f"🔍 Debugging PolyU detail page for ref: {args.debug_polyu}")
         scrape_polyu_detail(args.debug_polyu, debug=True)
@@ -2113,22 +2665,33 @@ def main():
             sys.exit(1)
         all_jobs = SCRAPERS[uni]()
     else:
-        # Scrape all
-        for name, scraper in SCRAPERS.items():
-            try:
-                jobs = scraper()
-                all_jobs.extend(jobs)
-                time.sleep(1)  # polite delay between universities
-            except Exception as e:
-                print(f"  ❌ {name} crashed: {e}")
+        # Scrape all concurrently — every scraper hits a different host and is
+        # dominated by network/browser waits, so wall time ≈ the slowest one.
+        # One shared Chromium serves the Playwright scrapers; each thread
+        # attaches with its own driver and context (see browser_context).
+        launch_shared_browser()
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as ex:
+                futures = {ex.submit(scraper): name for name, scraper in SCRAPERS.items()}
+                for future in as_completed(futures):
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        print(f"  ❌ {futures[future]} crashed: {e}")
+        finally:
+            close_shared_browser()
+        # Merge in SCRAPERS order, not completion order, so deduplicate()
+        # (first wins) and the CSV row order are the same on every run
+        for name in SCRAPERS:
+            all_jobs.extend(results.get(name, []))
 
     all_jobs = deduplicate(all_jobs)
     # Keep: active jobs, no-deadline jobs, and jobs closed within the last 14 days
     all_jobs = [j for j in all_jobs if is_within_retention(j.get("deadline", ""))]
 
-    # Re-rank using both title and description now that descriptions are available
-    for j in all_jobs:
-        j["rank"] = detect_rank(j["title"], j.get("description", ""))
+    # Rank/type every job in one pass, now that descriptions are available
+    classify(all_jobs)
 
     # Override is_new and set date_added based on previous run.
     # is_new = TRUE only for job IDs not seen in the previous CSV (new today).
@@ -2184,12 +2747,7 @@ def main():
     print(f"📊 New today          : {new_count}")
     print(f"📊 Closed / expired   : {len(all_jobs) - active_count}")
 
-    # Write CSV
-    OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(all_jobs)
+    write_jobs_csv(all_jobs, OUTPUT_FILE)
 
     print(f"✅ Saved to {OUTPUT_FILE}")
     print(f"🌐 Your website will update automatically within minutes.\n")